@@ -1,9 +1,27 @@
 """Backdrop - Simple server daemon manager."""
 
-__version__ = "0.1.0"
+from typing import TYPE_CHECKING, Any
+
+__version__ = "0.2.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from backdrop.process import ProcessManager
+if TYPE_CHECKING:
+    from backdrop.async_process import AsyncProcessManager
+    from backdrop.process import ProcessManager
+
+__all__ = ["AsyncProcessManager", "ProcessManager", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    # ProcessManager pulls in psutil, so only import it when asked for; this
+    # keeps ``import backdrop`` (and with it ``bd --help``) cheap.
+    if name == "ProcessManager":
+        from backdrop.process import ProcessManager
+
+        return ProcessManager
+    if name == "AsyncProcessManager":
+        from backdrop.async_process import AsyncProcessManager
 
-__all__ = ["ProcessManager", "__version__"]
+        return AsyncProcessManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,29 @@
 """Entry point for backdrop CLI."""
 
-
-from backdrop.cli import cli
+import sys
 
 
 def main() -> None:
     """Main entry point for the backdrop CLI."""
+    # Answer --version without importing click and the command definitions
+    if sys.argv[1:] == ["--version"]:
+        from backdrop import __version__
+
+        # Same message as click.version_option in backdrop.cli
+        print(f"backdrop, version {__version__}")
+        return
+
+    # Serve bd --help from the cache written by the previous --help run
+    if sys.argv[1:] == ["--help"]:
+        from backdrop.help_cache import help_cache_key, read_cached_help
+
+        help_text = read_cached_help(help_cache_key("bd"))
+        if help_text is not None:
+            print(help_text)
+            return
+
+    from backdrop.cli import cli
+
     cli(prog_name="bd")
 
 
@@ -0,0 +1,146 @@
+"""asyncio interface to backdrop's process management.
+
+AsyncProcessManager mirrors ProcessManager for callers that run an event
+loop, e.g. a service supervising its own helpers. Blocking work runs in the
+loop's default executor so it never stalls other tasks, and following a log
+waits on the inotify file descriptor with ``loop.add_reader`` instead of a
+sleeping thread.
+"""
+
+import asyncio
+import functools
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, TypeVar
+
+from backdrop.logger import tail_bytes, watch_file
+from backdrop.process import ProcessManager
+
+T = TypeVar("T")
+
+
+async def _run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call in the default executor (asyncio.to_thread needs 3.9)."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+class AsyncProcessManager:
+    """Manages background processes for backdrop from asyncio code."""
+
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        start_verify_delay: float = 0.25,
+        restart_delay: float = 0.5,
+        log_poll_interval: float = 0.05,
+    ) -> None:
+        """Initialize the process manager.
+
+        Args:
+            base_dir: Base directory for pids and logs (default: current directory)
+            start_verify_delay: Maximum time to watch a started process for an
+                immediate exit (default: 0.25s)
+            restart_delay: Delay between stop and start during restart (default: 0.5s)
+            log_poll_interval: Polling interval for log following when inotify is
+                unavailable (default: 0.05s)
+        """
+        self.manager = ProcessManager(
+            base_dir=base_dir,
+            start_verify_delay=start_verify_delay,
+            restart_delay=restart_delay,
+            log_poll_interval=log_poll_interval,
+        )
+
+    async def start(
+        self, command: str, name: Optional[str] = None, cwd: Optional[Path] = None
+    ) -> Optional[int]:
+        """Start a process in the background, see ProcessManager.start()."""
+        return await _run_blocking(self.manager.start, command, name, cwd)
+
+    async def stop(self, name: str, timeout: int = 5) -> bool:
+        """Stop a running process, see ProcessManager.stop()."""
+        return await _run_blocking(self.manager.stop, name, timeout)
+
+    async def restart(self, name: str, timeout: int = 5) -> Optional[int]:
+        """Restart a process, see ProcessManager.restart()."""
+        return await _run_blocking(self.manager.restart, name, timeout)
+
+    async def stop_all(self, timeout: int = 5) -> int:
+        """Stop all running processes, see ProcessManager.stop_all()."""
+        return await _run_blocking(self.manager.stop_all, timeout)
+
+    async def status(self, verbose: bool = False) -> List[Dict]:
+        """Get status of all managed processes.
+
+        In verbose mode the per-process psutil lookups run concurrently.
+
+        Args:
+            verbose: Include detailed information
+
+        Returns:
+            List of process information dictionaries
+        """
+        entries = await _run_blocking(self.manager.status_entries)
+        if verbose:
+            lookups = await asyncio.gather(
+                *(_run_blocking(self.manager.status_infos, [entry], verbose) for entry in entries)
+            )
+            infos = [info for lookup in lookups for info in lookup]
+        else:
+            infos = await _run_blocking(self.manager.status_infos, entries)
+        return await _run_blocking(self.manager.build_status, entries, infos, verbose)
+
+    async def tail_logs(
+        self, name: str, lines: int = 20, follow: bool = False, error: bool = False
+    ) -> AsyncIterator[str]:
+        """Yield the last lines of a process log, optionally following new lines.
+
+        Args:
+            name: Process name
+            lines: Number of lines to yield initially (default: 20)
+            follow: Whether to keep yielding lines as they are written (default: False)
+            error: Read the stderr log instead of the stdout log (default: False)
+
+        Yields:
+            Log lines without their trailing newline
+
+        Raises:
+            FileNotFoundError: If the process has no such log file
+        """
+        stdout_log, stderr_log = self.manager.get_log_files(name)
+        log_file = stderr_log if error else stdout_log
+        if log_file is None:
+            raise FileNotFoundError(f"No {'error ' if error else ''}log file found for {name}")
+
+        tail = await _run_blocking(tail_bytes, log_file, lines)
+        for line in tail.decode("utf-8", errors="replace").splitlines():
+            yield line
+
+        if not follow:
+            return
+
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+        inotify = watch_file(log_file)
+        if inotify is not None:
+            loop.add_reader(inotify.fd, changed.set)
+        try:
+            with open(log_file, encoding="utf-8", errors="replace") as f:
+                # Go to end of file
+                f.seek(0, 2)
+
+                while True:
+                    line = f.readline()
+                    if line:
+                        yield line.rstrip("\n")
+                    elif inotify is not None:
+                        # Wait until the file is written to
+                        await changed.wait()
+                        changed.clear()
+                        inotify.read(timeout=0)
+                    else:
+                        await asyncio.sleep(self.manager.log_poll_interval)
+        finally:
+            if inotify is not None:
+                loop.remove_reader(inotify.fd)
+                inotify.close()
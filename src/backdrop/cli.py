@@ -1,22 +1,76 @@
 """Command-line interface for backdrop."""
 
+import functools
+import json
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from backdrop import __version__
+from backdrop.help_cache import help_cache_key, read_cached_help, write_cached_help
 from backdrop.logger import setup_logger, tail_log_file
-from backdrop.process import ProcessManager
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from backdrop.process import ProcessManager
+
 logger = setup_logger("backdrop.cli")
 
 
-@click.group()
+@functools.lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """Return the shared rich console, importing rich on first use.
+
+    rich and psutil dominate import time, so they are only loaded by the
+    commands that need them; ``bd --help`` and ``bd --version`` never do.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def _get_manager(ctx: click.Context) -> "ProcessManager":
+    """Return the ProcessManager for this invocation, creating it on first use.
+
+    Args:
+        ctx: Click context; the group callback stores the manager options in
+            ``ctx.obj``
+
+    Returns:
+        The shared ProcessManager instance
+    """
+    if "manager" not in ctx.obj:
+        from backdrop.process import ProcessManager
+
+        ctx.obj["manager"] = ProcessManager(**ctx.obj["manager_options"])
+    manager: ProcessManager = ctx.obj["manager"]
+    return manager
+
+
+class CachedHelpGroup(click.Group):
+    """Click group that caches its formatted help text on disk.
+
+    The top-level help only changes with the version, program name, terminal
+    width and command definitions, so it is rendered once and then reused,
+    including by the ``bd --help`` fast path in ``__main__``.
+    """
+
+    def get_help(self, ctx: click.Context) -> str:
+        if ctx.parent is not None:
+            return super().get_help(ctx)
+
+        key = help_cache_key(ctx.info_name or "")
+        help_text = read_cached_help(key)
+        if help_text is None:
+            help_text = super().get_help(ctx)
+            write_cached_help(key, help_text)
+        return help_text
+
+
+@click.group(cls=CachedHelpGroup)
 @click.version_option(version=__version__, prog_name="backdrop")
 @click.option(
     "--cwd",
@@ -28,7 +82,7 @@ logger = setup_logger("backdrop.cli")
     "--start-verify-delay",
     type=float,
     default=0.25,
-    help="Delay after starting to verify process (default: 0.25s)",
+    help="Time to watch a started process for an immediate exit (default: 0.25s)",
 )
 @click.option(
     "--restart-delay",
@@ -40,7 +94,7 @@ logger = setup_logger("backdrop.cli")
     "--log-poll-interval",
     type=float,
     default=0.05,
-    help="Polling interval for log following (default: 0.05s)",
+    help="Polling interval for log following without inotify (default: 0.05s)",
 )
 @click.pass_context
 def cli(
@@ -55,12 +109,14 @@ def cli(
     Run any server in the background with automatic logging.
     """
     ctx.ensure_object(dict)
-    ctx.obj["manager"] = ProcessManager(
-        base_dir=cwd,
-        start_verify_delay=start_verify_delay,
-        restart_delay=restart_delay,
-        log_poll_interval=log_poll_interval,
-    )
+    # The manager itself is created on first use (see _get_manager), so that
+    # e.g. ``bd status --help`` neither imports psutil nor creates directories
+    ctx.obj["manager_options"] = {
+        "base_dir": cwd,
+        "start_verify_delay": start_verify_delay,
+        "restart_delay": restart_delay,
+        "log_poll_interval": log_poll_interval,
+    }
     logger.info(
         f"CLI initialized - version={__version__}, cwd={cwd}, "
         f"start_verify_delay={start_verify_delay}s, "
@@ -78,7 +134,7 @@ def start(ctx: click.Context, command: List[str], name: Optional[str]) -> None:
 
     COMMAND is the shell command to run.
     """
-    manager: ProcessManager = ctx.obj["manager"]
+    manager = _get_manager(ctx)
     shell_command = " ".join(command)
     logger.info(f"Start command - command={shell_command}, name={name}")
 
@@ -95,7 +151,7 @@ def start(ctx: click.Context, command: List[str], name: Optional[str]) -> None:
 @click.pass_context
 def stop(ctx: click.Context, name: str, timeout: int) -> None:
     """Stop a running server."""
-    manager: ProcessManager = ctx.obj["manager"]
+    manager = _get_manager(ctx)
     logger.info(f"Stop command - name={name}, timeout={timeout}")
 
     if manager.stop(name, timeout):
@@ -110,7 +166,7 @@ def stop(ctx: click.Context, name: str, timeout: int) -> None:
 @click.pass_context
 def restart(ctx: click.Context, name: str, timeout: int) -> None:
     """Restart a server."""
-    manager: ProcessManager = ctx.obj["manager"]
+    manager = _get_manager(ctx)
     logger.info(f"Restart command - name={name}, timeout={timeout}")
 
     pid = manager.restart(name, timeout)
@@ -122,18 +178,49 @@ def restart(ctx: click.Context, name: str, timeout: int) -> None:
 
 @cli.command()
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed information")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Choice(["table", "json", "plain"]),
+    default=None,
+    help="Output format (default: table on a terminal, plain otherwise)",
+)
 @click.pass_context
-def status(ctx: click.Context, verbose: bool) -> None:
+def status(ctx: click.Context, verbose: bool, output: Optional[str]) -> None:
     """Show status of all servers."""
-    manager: ProcessManager = ctx.obj["manager"]
-    logger.info(f"Status command - verbose={verbose}")
+    manager = _get_manager(ctx)
+    if output is None:
+        output = "table" if sys.stdout.isatty() else "plain"
+    logger.info(f"Status command - verbose={verbose}, output={output}")
 
     processes = manager.status(verbose)
 
+    # Machine-readable formats skip rich entirely
+    if output == "json":
+        print(json.dumps(processes))
+        return
+
+    from backdrop.utils import format_status
+
+    processes = [format_status(proc) for proc in processes]
+
+    columns = ["name", "status", "pid", "uptime"]
+    if verbose:
+        columns.extend(["cpu_percent", "memory", "command"])
+
+    if output == "plain":
+        for proc in processes:
+            print("\t".join(str(proc.get(column, "")) for column in columns))
+        return
+
+    console = _get_console()
+
     if not processes:
         console.print("No servers are running.", style="yellow")
         return
 
+    from rich.table import Table
+
     # Create table
     table = Table(title="Running Servers")
     table.add_column("Name", style="cyan")
@@ -177,12 +264,13 @@ def status(ctx: click.Context, verbose: bool) -> None:
 @click.pass_context
 def logs(ctx: click.Context, name: str, lines: int, follow: bool, error: bool) -> None:
     """View server logs."""
-    manager: ProcessManager = ctx.obj["manager"]
+    manager = _get_manager(ctx)
     logger.info(f"Logs command - name={name}, lines={lines}, follow={follow}, error={error}")
 
     stdout_log, stderr_log = manager.get_log_files(name)
 
     log_file = stderr_log if error else stdout_log
+    console = _get_console()
 
     if not log_file:
         console.print(f"No log file found for {name}", style="red")
@@ -195,16 +283,16 @@ def logs(ctx: click.Context, name: str, lines: int, follow: bool, error: bool) -
 
 
 @cli.command(name="stop-all")
-@click.option("--timeout", "-t", default=5, help="Timeout in seconds per server")
+@click.option("--timeout", "-t", default=5, help="Timeout in seconds")
 @click.confirmation_option(prompt="Stop all running servers?")
 @click.pass_context
 def stop_all(ctx: click.Context, timeout: int) -> None:
     """Stop all running servers."""
-    manager: ProcessManager = ctx.obj["manager"]
+    manager = _get_manager(ctx)
     logger.info(f"Stop-all command - timeout={timeout}")
 
     stopped = manager.stop_all(timeout)
-    console.print(f"Stopped {stopped} server(s).", style="green")
+    _get_console().print(f"Stopped {stopped} server(s).", style="green")
 
 
 # Convenience aliases
@@ -0,0 +1,79 @@
+"""On-disk cache for the formatted top-level help text of the CLI.
+
+This module is imported by the ``bd --help`` fast path in ``__main__``, so it
+must stay free of heavy imports (click, rich, psutil).
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+from backdrop import __version__
+
+CLI_SOURCE = Path(__file__).with_name("cli.py")
+
+
+def help_cache_file() -> Path:
+    """Get the path of the help cache file for the installed version.
+
+    Returns:
+        Path under ``$XDG_CACHE_HOME/backdrop`` (default: ``~/.cache/backdrop``)
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "backdrop" / f"help-{__version__}.txt"
+
+
+def help_cache_key(prog_name: str) -> str:
+    """Build the key identifying one rendering of the help text.
+
+    The help text depends on the program name, the terminal width it is
+    wrapped to and the command definitions; the modification time of cli.py
+    stands in for the latter so editable installs do not show stale help.
+
+    Args:
+        prog_name: Program name shown in the usage line
+
+    Returns:
+        Cache key string (a single line)
+    """
+    columns = shutil.get_terminal_size().columns
+    try:
+        source_mtime = CLI_SOURCE.stat().st_mtime_ns
+    except OSError:
+        source_mtime = 0
+    return f"{prog_name} {columns} {source_mtime}"
+
+
+def read_cached_help(key: str) -> Optional[str]:
+    """Read the cached help text if it was rendered for the given key.
+
+    Args:
+        key: Cache key from help_cache_key()
+
+    Returns:
+        Cached help text, or None on a cache miss
+    """
+    try:
+        cached_key, _, text = help_cache_file().read_text(encoding="utf-8").partition("\n")
+    except OSError:
+        return None
+    return text if cached_key == key else None
+
+
+def write_cached_help(key: str, text: str) -> None:
+    """Store rendered help text in the cache, ignoring any I/O errors.
+
+    Args:
+        key: Cache key from help_cache_key()
+        text: Rendered help text
+    """
+    cache_file = help_cache_file()
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(f"{key}\n{text}", encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # A read-only or missing home directory only costs the cache
+        pass
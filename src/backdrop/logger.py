@@ -1,9 +1,11 @@
 """Logging configuration and utilities for backdrop."""
 
 import logging
+import mmap
+import os
 import sys
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 
 def setup_logger(
@@ -35,8 +37,9 @@ def setup_logger(
 
     formatter = logging.Formatter(format_string, datefmt="%Y-%m-%d %H:%M:%S")
 
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Console handler; diagnostics go to stderr so stdout carries only command
+    # output (e.g. ``bd status -o json`` stays parseable)
+    console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
@@ -62,7 +65,8 @@ def setup_process_logging(name: str, log_dir: Path) -> Tuple[Path, Path]:
     Returns:
         Tuple of (stdout_log_path, stderr_log_path)
     """
-    log_dir.mkdir(parents=True, exist_ok=True)
+    if not log_dir.is_dir():
+        log_dir.mkdir(parents=True, exist_ok=True)
 
     stdout_log = log_dir / f"{name}.log"
     stderr_log = log_dir / f"{name}_error.log"
@@ -79,34 +83,104 @@ def tail_log_file(
         log_file: Path to log file
         lines: Number of lines to show initially (default: 20)
         follow: Whether to follow new lines (default: False)
-        poll_interval: Polling interval in seconds for follow mode (default: 0.05s)
+        poll_interval: Polling interval in seconds for follow mode when inotify is
+            unavailable (default: 0.05s)
     """
-    if not log_file.exists():
+    # Copy the last N lines straight through, without decoding them
+    try:
+        tail = tail_bytes(log_file, lines)
+    except FileNotFoundError:
         print(f"Log file not found: {log_file}")
         return
-
-    # Read last N lines
-    with open(log_file, encoding="utf-8") as f:
-        file_lines = f.readlines()
-        last_lines = file_lines[-lines:] if len(file_lines) > lines else file_lines
-
-        for line in last_lines:
-            print(line.rstrip())
+    if tail:
+        if not tail.endswith(b"\n"):
+            tail += b"\n"
+        sys.stdout.flush()
+        sys.stdout.buffer.write(tail)
+        sys.stdout.buffer.flush()
 
     if follow:
-        # Follow mode - watch for new lines
+        # Follow mode - watch for new data
         import time
 
+        inotify = watch_file(log_file)
+        out = sys.stdout.buffer
         try:
-            with open(log_file, encoding="utf-8") as f:
+            with open(log_file, "rb") as f:
                 # Go to end of file
                 f.seek(0, 2)
 
                 while True:
-                    line = f.readline()
-                    if line:
-                        print(line.rstrip())
+                    data = f.read()
+                    if data:
+                        out.write(data)
+                        out.flush()
+                    elif inotify is not None:
+                        # Block until the file is written to; no timeout, so an
+                        # idle follower makes no syscalls at all
+                        inotify.read()
                     else:
                         time.sleep(poll_interval)
         except KeyboardInterrupt:
             print("\nStopped following log file.")
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+
+def tail_bytes(path: Path, n_lines: int) -> bytes:
+    """Read the last lines of a file without loading the whole file.
+
+    The file is memory-mapped and newlines are located with ``mmap.rfind``
+    from the end, so only the pages holding the tail are ever read.
+
+    Args:
+        path: File to read
+        n_lines: Number of lines to return
+
+    Returns:
+        Raw bytes of up to ``n_lines`` trailing lines
+    """
+    if n_lines <= 0:
+        return b""
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return b""
+
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+            # A trailing newline terminates the last line rather than starting a new one
+            start = size - 1 if mm[size - 1 : size] == b"\n" else size
+            for _ in range(n_lines):
+                start = mm.rfind(b"\n", 0, start)
+                if start < 0:
+                    break
+            return mm[start + 1 :]
+
+
+def watch_file(path: Path) -> Optional[Any]:
+    """Create an inotify watch for modifications to a file.
+
+    Args:
+        path: File to watch
+
+    Returns:
+        An ``inotify_simple.INotify`` instance, or None if inotify is unavailable
+        (non-Linux platforms or the optional dependency is not installed)
+    """
+    try:
+        from inotify_simple import INotify, flags
+    except ImportError:
+        return None
+
+    try:
+        inotify = INotify()
+    except OSError:
+        return None
+    try:
+        inotify.add_watch(str(path), flags.MODIFY)
+    except OSError:
+        inotify.close()
+        return None
+    return inotify
@@ -1,26 +1,52 @@
 """Core process management functionality for backdrop."""
 
+import contextlib
+import fcntl
+import functools
 import os
-import subprocess
-import sys
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, cast
 
 from backdrop.logger import setup_logger, setup_process_logging
 from backdrop.utils import (
-    daemonize,
+    PidRecord,
+    child_has_exited,
+    command_argv,
     ensure_directories,
-    format_memory,
-    format_uptime,
+    get_create_time,
     get_process_info,
     is_process_running,
     kill_process_tree,
+    kill_process_trees,
+    live_process_start_times,
+    read_pid_file,
+    reap_child,
+    same_create_time,
     sanitize_name,
+    spawn_process,
+    write_pid_file,
 )
 
 logger = setup_logger("backdrop.process")
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+# A readable PID file, as (name, pid_file, pid, create_time)
+StatusEntry = Tuple[str, Path, int, Optional[float]]
+
+
+def _serialized(method: F) -> F:
+    """Run a ProcessManager method while holding the PID directory lock."""
+
+    @functools.wraps(method)
+    def wrapper(self: "ProcessManager", *args: Any, **kwargs: Any) -> Any:
+        with self._locked():
+            return method(self, *args, **kwargs)
+
+    return cast(F, wrapper)
+
 
 class ProcessManager:
     """Manages background processes for backdrop."""
@@ -36,15 +62,27 @@ class ProcessManager:
 
         Args:
             base_dir: Base directory for pids and logs (default: current directory)
-            start_verify_delay: Delay after starting to verify process (default: 0.25s)
+            start_verify_delay: Maximum time to watch a started process for an
+                immediate exit (default: 0.25s)
             restart_delay: Delay between stop and start during restart (default: 0.5s)
-            log_poll_interval: Polling interval for log following (default: 0.05s)
+            log_poll_interval: Polling interval for log following when inotify is
+                unavailable (default: 0.05s)
         """
         self.base_dir = Path(base_dir) if base_dir else Path.cwd()
         self.pids_dir, self.logs_dir = ensure_directories(self.base_dir)
+        # String prefix for log paths, so lookups skip building Path objects
+        self._logs_prefix = os.path.join(self.logs_dir, "")
         self.start_verify_delay = start_verify_delay
         self.restart_delay = restart_delay
         self.log_poll_interval = log_poll_interval
+        self._lock_file: Optional[IO[str]] = None
+        # Serializes threads sharing this manager (e.g. AsyncProcessManager's
+        # executor); _lock_file is only set while this is held
+        self._thread_lock = threading.RLock()
+        # Parsed PID files keyed by path, with the (mtime, inode, size) they were read at
+        self._pid_cache: Dict[Path, Tuple[Tuple[int, int, int], PidRecord]] = {}
+        # Open log file descriptors keyed by path, with the (device, inode) opened
+        self._log_fds: Dict[Path, Tuple[int, Tuple[int, int]]] = {}
         logger.info(
             f"ProcessManager initialized - base_dir={self.base_dir}, "
             f"pids_dir={self.pids_dir}, logs_dir={self.logs_dir}, "
@@ -53,6 +91,135 @@ class ProcessManager:
             f"log_poll_interval={log_poll_interval}s"
         )
 
+    def _pid_entries(self) -> Iterator["os.DirEntry[str]"]:
+        """Iterate over the PID files in the PID directory.
+
+        A single scandir pass; callers take the name and path from the
+        entries instead of re-deriving them per file.
+
+        Yields:
+            Directory entries of the ``*.pid`` files
+        """
+        with os.scandir(self.pids_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".pid"):
+                    yield entry
+
+    def _read_pid(self, pid_file: Path, entry: Optional["os.DirEntry[str]"] = None) -> PidRecord:
+        """Read a PID file, reusing the parsed contents if it is unchanged.
+
+        Args:
+            pid_file: Path of the PID file
+            entry: Directory entry of the PID file from _pid_entries(), whose
+                stat result is reused (optional)
+
+        Returns:
+            Record stored in the PID file, see read_pid_file()
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is empty or malformed
+        """
+        st = entry.stat(follow_symlinks=False) if entry is not None else pid_file.stat()
+        # PID files are replaced, never rewritten in place, so a new inode
+        # catches rewrites even within the filesystem's mtime granularity
+        version = (st.st_mtime_ns, st.st_ino, st.st_size)
+        with self._thread_lock:
+            cached = self._pid_cache.get(pid_file)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+            record = read_pid_file(pid_file)
+            self._pid_cache[pid_file] = (version, record)
+            return record
+
+    def _remove_pid_file(self, pid_file: Path) -> None:
+        """Remove a PID file and forget its cached contents.
+
+        Args:
+            pid_file: Path of the PID file
+        """
+        with self._thread_lock:
+            self._pid_cache.pop(pid_file, None)
+            pid_file.unlink(missing_ok=True)
+
+    def _log_fd(self, log_file: Path) -> int:
+        """Get an append-mode file descriptor for a log file.
+
+        Descriptors stay open across starts, so a long-lived manager that
+        restarts a process does not reopen its logs every time. A log file
+        that was removed or replaced (e.g. by log rotation) is reopened.
+
+        Args:
+            log_file: Path of the log file
+
+        Returns:
+            File descriptor opened with O_APPEND
+        """
+        cached = self._log_fds.pop(log_file, None)
+        if cached is not None:
+            fd, identity = cached
+            try:
+                st = os.stat(log_file)
+                if (st.st_dev, st.st_ino) == identity:
+                    self._log_fds[log_file] = cached
+                    return fd
+            except FileNotFoundError:
+                pass
+            os.close(fd)
+
+        fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        st = os.fstat(fd)
+        self._log_fds[log_file] = (fd, (st.st_dev, st.st_ino))
+        return fd
+
+    def _close_log_fds(self, name: str) -> None:
+        """Close the cached log file descriptors of a process.
+
+        Args:
+            name: Sanitized process name
+        """
+        for log_file in (self.logs_dir / f"{name}.log", self.logs_dir / f"{name}_error.log"):
+            cached = self._log_fds.pop(log_file, None)
+            if cached is not None:
+                os.close(cached[0])
+
+    def close(self) -> None:
+        """Close all cached log file descriptors."""
+        with self._thread_lock:
+            while self._log_fds:
+                os.close(self._log_fds.popitem()[1][0])
+
+    def __del__(self) -> None:
+        # __init__ may have failed before the descriptor cache was set up
+        if getattr(self, "_log_fds", None):
+            self.close()
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive lock on the PID directory.
+
+        Serializes check-then-act sequences on PID files (e.g. two concurrent
+        ``bd start`` calls for the same name) across backdrop invocations and
+        across threads sharing this manager. The lock is re-entrant within a
+        thread, so restart() can call start().
+        """
+        with self._thread_lock:
+            if self._lock_file is not None:
+                # Only the thread holding _thread_lock can get here re-entrantly
+                yield
+                return
+
+            # Closing the file releases the lock; spawned commands do not inherit it
+            with open(self.pids_dir / ".lock", "w", encoding="utf-8") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                self._lock_file = lock_file
+                try:
+                    yield
+                finally:
+                    self._lock_file = None
+
+    @_serialized
     def start(
         self,
         command: str,
@@ -81,94 +248,70 @@ class ProcessManager:
 
         # Check if already running
         pid_file = self.pids_dir / f"{name}.pid"
-        if pid_file.exists():
-            try:
-                with open(pid_file, encoding="utf-8") as f:
-                    existing_pid = int(f.read().strip())
-                if is_process_running(existing_pid):
-                    logger.warning(f"Process already running - name={name}, pid={existing_pid}")
-                    print(f"✗ {name} is already running (PID: {existing_pid})")
-                    return None
-                else:
-                    logger.info(
-                        f"Stale PID file found, removing - name={name}, " f"pid={existing_pid}"
-                    )
-                    pid_file.unlink()
-            except (OSError, ValueError) as e:
-                logger.error(f"Error reading PID file - error={e}")
-                pid_file.unlink()
+        try:
+            existing = self._read_pid(pid_file)
+            existing_pid = existing.pid
+            if is_process_running(existing_pid, existing.create_time):
+                logger.warning(f"Process already running - name={name}, pid={existing_pid}")
+                print(f"✗ {name} is already running (PID: {existing_pid})")
+                return None
+            else:
+                logger.info(f"Stale PID file found, removing - name={name}, pid={existing_pid}")
+                reap_child(existing_pid)
+                self._remove_pid_file(pid_file)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading PID file - error={e}")
+            self._remove_pid_file(pid_file)
 
         # Set up logging
         stdout_log, stderr_log = setup_process_logging(name, self.logs_dir)
 
-        # Fork to start the process
-        pid = os.fork()
-        if pid == 0:
-            # Child process
-            try:
-                # Daemonize
-                daemonize()
-
-                # Open log files
-                with open(stdout_log, "a", encoding="utf-8") as stdout_f, open(
-                    stderr_log, "a", encoding="utf-8"
-                ) as stderr_f:
-                    # Write startup message
-                    startup_msg = (
-                        f"\n{'='*60}\n"
-                        f"Starting {name} at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-                        f"Command: {command}\n"
-                        f"{'='*60}\n"
-                    )
-                    stdout_f.write(startup_msg)
-                    stdout_f.flush()
-
-                    # Execute the command
-                    proc = subprocess.Popen(
-                        command,
-                        shell=True,
-                        stdout=stdout_f,
-                        stderr=stderr_f,
-                        cwd=cwd or self.base_dir,
-                        preexec_fn=os.setsid,
-                    )
-
-                    # Write PID file
-                    with open(pid_file, "w", encoding="utf-8") as f:
-                        f.write(str(proc.pid))
-
-                    # Child process exits immediately - daemon runs independently
-
-            except Exception as e:
-                logger.error(f"Error in child process - error={e}")
-                sys.exit(1)
-            # Exit child process normally
-            sys.exit(0)
-        else:
-            # Parent process
-            # Wait a bit to ensure the process started
-            time.sleep(self.start_verify_delay)
-
-            # Read the actual PID from the file
-            if pid_file.exists():
-                try:
-                    with open(pid_file, encoding="utf-8") as f:
-                        actual_pid = int(f.read().strip())
-                    if is_process_running(actual_pid):
-                        logger.info(
-                            f"Process started successfully - name={name}, " f"pid={actual_pid}"
-                        )
-                        print(f"✓ Started {name} (PID: {actual_pid})")
-                        print(f"    Logs: {stdout_log}")
-                        print(f"    Errors: {stderr_log}")
-                        return actual_pid
-                except (OSError, ValueError) as e:
-                    logger.error(f"Error reading PID file after start - error={e}")
-
-            logger.error(f"Failed to start process - name={name}")
-            print(f"✗ Failed to start {name}")
+        # Write startup message as a single unbuffered append
+        startup_msg = (
+            f"\n{'='*60}\n"
+            f"Starting {name} at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Command: {command}\n"
+            f"{'='*60}\n"
+        )
+        stdout_fd = self._log_fd(stdout_log)
+        stderr_fd = self._log_fd(stderr_log)
+        os.write(stdout_fd, startup_msg.encode("utf-8"))
+
+        # Spawn the command directly in its own session; no fork of this
+        # (possibly large) process is needed, and the PID is known right away
+        work_dir = cwd or self.base_dir
+        try:
+            pid = spawn_process(command_argv(command, work_dir), stdout_fd, stderr_fd, work_dir)
+        except OSError as e:
+            logger.error(f"Failed to start process - name={name}, error={e}")
+            print(f"✗ Failed to start {name}: {e}")
             return None
 
+        # Write PID file
+        write_pid_file(
+            pid_file, PidRecord(pid, get_create_time(pid), command, os.path.abspath(work_dir))
+        )
+
+        # Exec failures were already raised by spawn_process; a command that
+        # fails right away (missing script, bad arguments) exits within the
+        # verify window, which ends early as soon as the process exits
+        if not child_has_exited(pid, self.start_verify_delay):
+            logger.info(f"Process started successfully - name={name}, pid={pid}")
+            print(f"✓ Started {name} (PID: {pid})")
+            print(f"    Logs: {stdout_log}")
+            print(f"    Errors: {stderr_log}")
+            return pid
+
+        logger.error(f"Failed to start process - name={name}")
+        print(f"✗ Failed to start {name}")
+        # The child has exited; collect it so it does not linger as a zombie
+        reap_child(pid, block=True)
+        self._remove_pid_file(pid_file)
+        return None
+
+    @_serialized
     def stop(self, name: str, timeout: int = 5) -> bool:
         """Stop a running process.
 
@@ -184,38 +327,72 @@ class ProcessManager:
 
         logger.info(f"Stopping process - name={name}")
 
-        if not pid_file.exists():
-            logger.warning(f"PID file not found - name={name}")
-            print(f"✗ {name} is not running")
+        # Log descriptors are only worth keeping for restarts
+        self._close_log_fds(name)
+
+        pid = self._running_pid(name, pid_file)
+        if pid is None:
             return False
 
+        return self._finish_stop(name, pid_file, pid, kill_process_tree(pid, timeout))
+
+    def _running_pid(self, name: str, pid_file: Path) -> Optional[int]:
+        """Read the PID of a process that is about to be stopped.
+
+        Stale PID files are removed along the way.
+
+        Args:
+            name: Sanitized process name
+            pid_file: PID file of the process
+
+        Returns:
+            Process ID if the process is running, None otherwise
+        """
         try:
-            with open(pid_file, encoding="utf-8") as f:
-                pid = int(f.read().strip())
+            record = self._read_pid(pid_file)
+            pid = record.pid
 
-            if not is_process_running(pid):
+            if not is_process_running(pid, record.create_time):
                 logger.info(f"Process not running, cleaning up - name={name}, pid={pid}")
-                pid_file.unlink()
+                reap_child(pid)
+                self._remove_pid_file(pid_file)
                 print(f"✗ {name} is not running (cleaned up stale PID file)")
-                return False
-
-            # Kill the process
-            if kill_process_tree(pid, timeout):
-                logger.info(f"Process stopped successfully - name={name}, pid={pid}")
-                if pid_file.exists():
-                    pid_file.unlink()
-                print(f"✓ Stopped {name} (PID: {pid})")
-                return True
-            else:
-                logger.error(f"Failed to stop process - name={name}, pid={pid}")
-                print(f"✗ Failed to stop {name}")
-                return False
+                return None
 
+            return pid
+
+        except FileNotFoundError:
+            logger.warning(f"PID file not found - name={name}")
+            print(f"✗ {name} is not running")
+            return None
         except (OSError, ValueError) as e:
             logger.error(f"Error reading PID file - name={name}, error={e}")
             print(f"✗ Error stopping {name}: {e}")
-            return False
+            return None
+
+    def _finish_stop(self, name: str, pid_file: Path, pid: int, killed: bool) -> bool:
+        """Report the outcome of killing a process and remove its PID file.
+
+        Args:
+            name: Sanitized process name
+            pid_file: PID file of the process
+            pid: Process ID that was killed
+            killed: Whether the kill succeeded
+
+        Returns:
+            True if process was stopped, False otherwise
+        """
+        if killed:
+            logger.info(f"Process stopped successfully - name={name}, pid={pid}")
+            self._remove_pid_file(pid_file)
+            print(f"✓ Stopped {name} (PID: {pid})")
+            return True
+
+        logger.error(f"Failed to stop process - name={name}, pid={pid}")
+        print(f"✗ Failed to stop {name}")
+        return False
 
+    @_serialized
     def restart(self, name: str, timeout: int = 5) -> Optional[int]:
         """Restart a process.
 
@@ -231,34 +408,38 @@ class ProcessManager:
 
         # Get the original command
         pid_file = self.pids_dir / f"{name}.pid"
-        if not pid_file.exists():
-            logger.warning(f"Cannot restart, process not running - name={name}")
-            print(f"✗ {name} is not running")
-            return None
-
         try:
-            with open(pid_file, encoding="utf-8") as f:
-                pid = int(f.read().strip())
-
-            # Get process info before stopping
-            info = get_process_info(pid)
-            if not info:
-                logger.error(f"Cannot get process info - name={name}, pid={pid}")
-                print(f"✗ Cannot get process info for {name}")
-                return None
+            record = self._read_pid(pid_file)
+            pid = record.pid
 
-            command = info["cmdline"]
+            if record.command is not None and is_process_running(pid, record.create_time):
+                command = record.command
+            else:
+                # PID files from older versions do not record the command, so
+                # recover it from the running process
+                info = get_process_info(pid, record.create_time)
+                if not info:
+                    logger.error(f"Cannot get process info - name={name}, pid={pid}")
+                    print(f"✗ Cannot get process info for {name}")
+                    return None
+                command = info["cmdline"]
+            cwd = Path(record.cwd) if record.cwd is not None else None
 
-            # Stop the process
-            if self.stop(name, timeout):
+            # Stop the process; the PID was just read and confirmed running, so
+            # skip stop()'s second read of the PID file
+            if self._finish_stop(name, pid_file, pid, kill_process_tree(pid, timeout)):
                 # Wait a bit before restarting
                 time.sleep(self.restart_delay)
                 # Start it again
-                return self.start(command, name)
+                return self.start(command, name, cwd)
             else:
                 logger.error(f"Failed to stop process for restart - name={name}")
                 return None
 
+        except FileNotFoundError:
+            logger.warning(f"Cannot restart, process not running - name={name}")
+            print(f"✗ {name} is not running")
+            return None
         except (OSError, ValueError) as e:
             logger.error(f"Error during restart - name={name}, error={e}")
             print(f"✗ Error restarting {name}: {e}")
@@ -267,35 +448,105 @@ class ProcessManager:
     def status(self, verbose: bool = False) -> List[Dict]:
         """Get status of all managed processes.
 
+        Fields are raw numbers (``uptime_seconds``, and with verbose
+        ``cpu_percent``, ``memory_rss`` in bytes and ``memory_percent``);
+        use format_status() to render them for display. Before 0.2.0 these
+        were the display strings ``uptime``, ``cpu_percent``, ``memory`` and
+        ``memory_percent``, which format_status() still produces.
+
         Args:
             verbose: Include detailed information
 
         Returns:
             List of process information dictionaries
         """
-        processes = []
+        entries = self.status_entries()
+        return self.build_status(entries, self.status_infos(entries, verbose), verbose)
 
-        for pid_file in self.pids_dir.glob("*.pid"):
-            name = pid_file.stem
+    def status_entries(self) -> List[StatusEntry]:
+        """Read all PID files; the first step of status().
+
+        Returns:
+            List of (name, pid_file, pid, create_time) tuples; unreadable PID
+            files are logged and skipped
+        """
+        entries = []
+        for entry in self._pid_entries():
+            name = entry.name[:-4]
+            pid_file = Path(entry.path)
             try:
-                with open(pid_file, encoding="utf-8") as f:
-                    pid = int(f.read().strip())
+                record = self._read_pid(pid_file, entry)
+            except (OSError, ValueError) as e:
+                logger.error(f"Error reading PID file - name={name}, error={e}")
+                continue
+            entries.append((name, pid_file, record.pid, record.create_time))
+        return entries
+
+    def status_infos(
+        self, entries: List[StatusEntry], verbose: bool = False
+    ) -> List[Optional[dict]]:
+        """Look up the processes of PID file entries; the second step of status().
+
+        Without verbose only the start time is needed, which can be read from
+        /proc for all processes at once; psutil is used where /proc is not
+        available. Entries are looked up independently, so callers may split
+        them up and look them up concurrently.
+
+        Args:
+            entries: Entries from status_entries()
+            verbose: Include detailed information
+
+        Returns:
+            Info dict per entry (just ``create_time`` without verbose, see
+            get_process_info() otherwise), or None if not running
+        """
+        start_times = None if verbose else live_process_start_times([e[2] for e in entries])
+        if start_times is None:
+            return [get_process_info(pid, create_time) for _, _, pid, create_time in entries]
+
+        infos: List[Optional[dict]] = []
+        for _, _, pid, create_time in entries:
+            started = start_times.get(pid)
+            alive = started is not None and same_create_time(started, create_time)
+            infos.append({"create_time": started} if alive else None)
+        return infos
+
+    def build_status(
+        self, entries: List[StatusEntry], infos: List[Optional[dict]], verbose: bool = False
+    ) -> List[Dict]:
+        """Turn process infos into status rows; the last step of status().
+
+        PID files of processes that are no longer running are removed, unless
+        they were replaced (e.g. by a concurrent ``bd start``) since
+        status_entries() read them.
+
+        Args:
+            entries: Entries from status_entries()
+            infos: Process info per entry (None if the process is not running)
+            verbose: Include detailed information
+
+        Returns:
+            List of process information dictionaries
+        """
+        processes = []
+        now = time.time()
 
-                info = get_process_info(pid)
+        for (name, pid_file, pid, create_time), info in zip(entries, infos):
+            try:
                 if info:
                     process_data = {
                         "name": name,
                         "pid": pid,
                         "status": "running",
-                        "uptime": format_uptime(info["create_time"]),
+                        "uptime_seconds": int(now - info["create_time"]),
                     }
 
                     if verbose:
                         process_data.update(
                             {
-                                "cpu_percent": f"{info['cpu_percent']:.1f}%",
-                                "memory": format_memory(info["memory_rss"]),
-                                "memory_percent": f"{info['memory_percent']:.1f}%",
+                                "cpu_percent": info["cpu_percent"],
+                                "memory_rss": info["memory_rss"],
+                                "memory_percent": info["memory_percent"],
                                 "command": info["cmdline"],
                             }
                         )
@@ -303,31 +554,70 @@ class ProcessManager:
                     processes.append(process_data)
                     logger.debug(f"Process status - name={name}, data={process_data}")
                 else:
-                    # Stale PID file
-                    logger.info(f"Removing stale PID file - name={name}, pid={pid}")
-                    pid_file.unlink()
+                    self._remove_stale_pid_file(name, pid_file, pid, create_time)
 
-            except (OSError, ValueError) as e:
-                logger.error(f"Error reading PID file - name={name}, error={e}")
+            except OSError as e:
+                logger.error(f"Error removing PID file - name={name}, error={e}")
                 continue
 
         return processes
 
+    def _remove_stale_pid_file(
+        self, name: str, pid_file: Path, pid: int, create_time: Optional[float]
+    ) -> None:
+        """Remove a PID file judged stale, if it still holds the same record.
+
+        Args:
+            name: Process name
+            pid_file: PID file of the process
+            pid: Process ID that was found not running
+            create_time: Recorded creation time that was found not running
+
+        Raises:
+            OSError: If the file cannot be removed
+        """
+        with self._locked():
+            try:
+                record = self._read_pid(pid_file)
+            except (OSError, ValueError):
+                return
+            if (record.pid, record.create_time) != (pid, create_time):
+                logger.debug(f"PID file replaced, keeping it - name={name}, pid={record.pid}")
+                return
+
+            logger.info(f"Removing stale PID file - name={name}, pid={pid}")
+            reap_child(pid)
+            self._remove_pid_file(pid_file)
+
+    @_serialized
     def stop_all(self, timeout: int = 5) -> int:
         """Stop all running processes.
 
+        All processes are signalled first and then waited for together, so
+        the whole shutdown takes at most one timeout.
+
         Args:
-            timeout: Timeout for each process
+            timeout: Timeout in seconds for graceful shutdown
 
         Returns:
             Number of processes stopped
         """
         logger.info("Stopping all processes")
         stopped = 0
-
-        for pid_file in self.pids_dir.glob("*.pid"):
-            name = pid_file.stem
-            if self.stop(name, timeout):
+        self.close()
+
+        targets = []
+        for entry in self._pid_entries():
+            name = entry.name[:-4]
+            pid_file = Path(entry.path)
+            logger.info(f"Stopping process - name={name}")
+            pid = self._running_pid(name, pid_file)
+            if pid is not None:
+                targets.append((name, pid_file, pid))
+
+        results = kill_process_trees([pid for _, _, pid in targets], timeout)
+        for name, pid_file, pid in targets:
+            if self._finish_stop(name, pid_file, pid, results[pid]):
                 stopped += 1
 
         logger.info(f"Stopped {stopped} processes")
@@ -343,10 +633,10 @@ class ProcessManager:
             Tuple of (stdout_log, stderr_log) paths
         """
         name = sanitize_name(name)
-        stdout_log = self.logs_dir / f"{name}.log"
-        stderr_log = self.logs_dir / f"{name}_error.log"
+        stdout_log = f"{self._logs_prefix}{name}.log"
+        stderr_log = f"{self._logs_prefix}{name}_error.log"
 
         return (
-            stdout_log if stdout_log.exists() else None,
-            stderr_log if stderr_log.exists() else None,
+            Path(stdout_log) if os.path.exists(stdout_log) else None,
+            Path(stderr_log) if os.path.exists(stderr_log) else None,
         )
@@ -1,14 +1,62 @@
 """Utility functions for backdrop."""
 
 import contextlib
+import functools
+import itertools
+import json
 import os
+import re
+import selectors
+import shutil
+import signal
+import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import psutil
 
+# Minimum time between two CPU samples of the same process; calls in between
+# reuse the previous value instead of measuring over a meaninglessly short window
+CPU_SAMPLE_MIN_INTERVAL = 0.5
+
+# Largest difference between a recorded and an observed process start time that
+# still counts as the same process; anything else means the PID was reused
+CREATE_TIME_TOLERANCE = 1.0
+
+# Units used by format_memory(), in steps of 1024
+_MEMORY_UNITS = ["B", "KB", "MB", "GB", "TB", "PB"]
+
+# format_uptime() templates keyed by which of (days, hours, minutes, seconds) are
+# non-zero: the two largest non-zero units, or seconds if all are zero
+_UPTIME_FORMATS = {
+    nonzero: " ".join([f"{{{unit}}}{unit}" for unit, shown in zip("dhms", nonzero) if shown][:2])
+    or "{s}s"
+    for nonzero in itertools.product((False, True), repeat=4)
+}
+
+# Script extensions stripped from process names
+_SCRIPT_EXTENSIONS = frozenset(["py", "js", "rb", "sh"])
+
+# Anything but ASCII letters, digits, "-" and "_" is replaced in process names
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+# Anything beyond plain space-separated words needs /bin/sh to interpret it
+_SHELL_METACHARS = re.compile(r"[|&;<>()$`\\\"'*?\[\]{}~!#\n]")
+
+# Attributes fetched together by get_process_info()
+_INFO_ATTRS = ["name", "status", "create_time", "cmdline", "memory_info", "memory_percent"]
+
+# psutil.Process objects by PID with their last CPU sample (monotonic time,
+# percent), so repeated calls measure CPU usage since the previous call
+# instead of blocking in cpu_percent(interval=...)
+_process_cache: Dict[int, Tuple[psutil.Process, float, float]] = {}
+
+# Process start times can be read straight from /proc/<pid>/stat on Linux
+_HAVE_PROC_STAT = sys.platform.startswith("linux")
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if _HAVE_PROC_STAT else 100
+
 
 def format_uptime(start_time: float) -> str:
     """Format process uptime in human-readable format.
@@ -19,24 +67,24 @@ def format_uptime(start_time: float) -> str:
     Returns:
         Formatted uptime string (e.g., "5m 32s", "2h 15m")
     """
-    uptime_seconds = int(time.time() - start_time)
+    return format_duration(int(time.time() - start_time))
+
+
+def format_duration(total_seconds: int) -> str:
+    """Format a duration in human-readable format.
 
-    days = uptime_seconds // 86400
-    hours = (uptime_seconds % 86400) // 3600
-    minutes = (uptime_seconds % 3600) // 60
-    seconds = uptime_seconds % 60
+    Args:
+        total_seconds: Duration in whole seconds
 
-    parts = []
-    if days > 0:
-        parts.append(f"{days}d")
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0:
-        parts.append(f"{minutes}m")
-    if seconds > 0 or not parts:
-        parts.append(f"{seconds}s")
+    Returns:
+        Formatted duration string (e.g., "5m 32s", "2h 15m")
+    """
+    minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
 
-    return " ".join(parts[:2])  # Show at most 2 units
+    uptime_format = _UPTIME_FORMATS[(days > 0, hours > 0, minutes > 0, seconds > 0)]
+    return uptime_format.format(d=days, h=hours, m=minutes, s=seconds)
 
 
 def format_memory(bytes_value: int) -> str:
@@ -48,68 +96,299 @@ def format_memory(bytes_value: int) -> str:
     Returns:
         Formatted memory string (e.g., "125.5 MB")
     """
-    value = float(bytes_value)
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if value < 1024.0:
-            return f"{value:.1f} {unit}"
-        value /= 1024.0
-    return f"{value:.1f} PB"
+    # Each unit is 2**10 times the previous one
+    shift = min(max(bytes_value.bit_length() - 1, 0) // 10, len(_MEMORY_UNITS) - 1)
+    return f"{bytes_value / (1 << (shift * 10)):.1f} {_MEMORY_UNITS[shift]}"
+
+
+def format_status(process: Dict) -> Dict:
+    """Render the numeric fields of a status entry for display.
+
+    Args:
+        process: Entry returned by ProcessManager.status()
+
+    Returns:
+        Copy of the entry with ``uptime`` added and ``cpu_percent``,
+        ``memory`` and ``memory_percent`` as strings when present
+    """
+    formatted = dict(process)
+    formatted["uptime"] = format_duration(process["uptime_seconds"])
+    if "memory_rss" in process:
+        formatted["cpu_percent"] = f"{process['cpu_percent']:.1f}%"
+        formatted["memory"] = format_memory(process["memory_rss"])
+        formatted["memory_percent"] = f"{process['memory_percent']:.1f}%"
+    return formatted
 
 
-def get_process_info(pid: int) -> Optional[dict]:
+def get_process_info(pid: int, create_time: Optional[float] = None) -> Optional[dict]:
     """Get detailed information about a process.
 
     Args:
         pid: Process ID
+        create_time: Expected process start time, to detect PID reuse (optional)
 
     Returns:
         Dictionary with process information, or None if process not found
     """
     try:
-        proc = psutil.Process(pid)
-
-        # Get process info with proper error handling
-        info = {
-            "pid": pid,
-            "name": proc.name(),
-            "status": proc.status(),
-            "create_time": proc.create_time(),
-            "cmdline": " ".join(proc.cmdline()),
-        }
-
-        # Try to get CPU and memory info
-        try:
-            info["cpu_percent"] = proc.cpu_percent(interval=0.1)
-            memory_info = proc.memory_info()
-            info["memory_rss"] = memory_info.rss
-            info["memory_percent"] = proc.memory_percent()
-        except (psutil.AccessDenied, psutil.NoSuchProcess):
-            info["cpu_percent"] = 0.0
-            info["memory_rss"] = 0
-            info["memory_percent"] = 0.0
+        cached = _process_cache.get(pid)
+        # is_running() also guards against the PID having been reused
+        if cached is not None and cached[0].is_running():
+            proc = cached[0]
+        else:
+            # Forget the old process before looking up the PID again, so
+            # entries for exited processes do not accumulate
+            _process_cache.pop(pid, None)
+            proc = psutil.Process(pid)
+            cached = None
+
+        if not _same_process(proc, create_time):
+            _process_cache.pop(pid, None)
+            return None
+
+        # One /proc snapshot serves both as_dict() and the CPU sample
+        with proc.oneshot():
+            attrs = proc.as_dict(attrs=_INFO_ATTRS)
+
+            info = {
+                "pid": pid,
+                "name": attrs["name"],
+                "status": attrs["status"],
+                "create_time": attrs["create_time"],
+                "cmdline": " ".join(attrs["cmdline"] or []),
+            }
+
+            # CPU and memory may be inaccessible (as_dict reports those as None)
+            memory_info = attrs["memory_info"]
+            try:
+                info["cpu_percent"] = _sample_cpu_percent(proc, cached)
+            except (psutil.AccessDenied, psutil.NoSuchProcess):
+                info["cpu_percent"] = 0.0
+            info["memory_rss"] = memory_info.rss if memory_info is not None else 0
+            info["memory_percent"] = attrs["memory_percent"] or 0.0
 
         return info
 
     except (psutil.NoSuchProcess, psutil.AccessDenied):
+        _process_cache.pop(pid, None)
         return None
 
 
-def is_process_running(pid: int) -> bool:
+def _sample_cpu_percent(
+    proc: psutil.Process, cached: Optional[Tuple[psutil.Process, float, float]]
+) -> float:
+    """Sample the CPU usage of a process without blocking.
+
+    Args:
+        proc: Process to sample
+        cached: Previous cache entry for the process, if any
+
+    Returns:
+        CPU usage in percent since the previous sample, or averaged over the
+        lifetime of the process on the first sample
+    """
+    now = time.monotonic()
+    if cached is None:
+        # Prime psutil's counters so the next call measures from here
+        proc.cpu_percent(interval=None)
+        cpu_times = proc.cpu_times()
+        elapsed = time.time() - proc.create_time()
+        cpu = 100.0 * (cpu_times.user + cpu_times.system) / elapsed if elapsed > 0 else 0.0
+    elif now - cached[1] < CPU_SAMPLE_MIN_INTERVAL:
+        return cached[2]
+    else:
+        cpu = proc.cpu_percent(interval=None)
+
+    _process_cache[proc.pid] = (proc, now, cpu)
+    return cpu
+
+
+def is_process_running(pid: int, create_time: Optional[float] = None) -> bool:
     """Check if a process with given PID is running.
 
     Args:
         pid: Process ID
+        create_time: Expected process start time, to detect PID reuse (optional)
 
     Returns:
         True if process is running, False otherwise
     """
+    if pid <= 0:
+        return False
+
+    # Signal 0 only checks that the PID exists: a single syscall
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The PID exists but belongs to another user
+        pass
+
+    if _HAVE_PROC_STAT:
+        started = _proc_start_time(pid)
+        return started is not None and same_create_time(started, create_time)
+
     try:
         proc = psutil.Process(pid)
+        if not _same_process(proc, create_time):
+            return False
         return proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         return False
 
 
+def child_has_exited(pid: int, timeout: float = 0.0) -> bool:
+    """Check whether a child process has exited, without reaping it.
+
+    Waits up to ``timeout`` seconds for the child to exit, on a pidfd where
+    available and otherwise polling with a short backoff, and returns as soon
+    as it does.
+
+    Args:
+        pid: Process ID of a child of the current process
+        timeout: Maximum time in seconds to wait for the child to exit (default: 0)
+
+    Returns:
+        True if the process has exited, False if it is still running
+    """
+    deadline = time.monotonic() + timeout
+    if timeout > 0:
+        _wait_for_exit([pid], deadline)
+
+    delay = 0.005
+    while True:
+        try:
+            # WNOWAIT leaves the child waitable, so its exit status is not lost
+            exited = os.waitid(os.P_PID, pid, os.WEXITED | os.WNOHANG | os.WNOWAIT) is not None
+        except (AttributeError, ChildProcessError):
+            # os.waitid is not available on macOS; ChildProcessError means the
+            # process was already reaped (or is not our child)
+            exited = not is_process_running(pid)
+
+        remaining = deadline - time.monotonic()
+        if exited or remaining <= 0:
+            return exited
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.05)
+
+
+def reap_child(pid: int, block: bool = False) -> None:
+    """Collect the exit status of a child process so it does not stay a zombie.
+
+    Long-lived managers (e.g. an AsyncProcessManager in a service) are the
+    parent of every process they started, so exited ones must be waited for.
+
+    Args:
+        pid: Process ID; nothing happens if it is not a child of the current process
+        block: Wait for the child to exit instead of returning right away
+            (default: False)
+    """
+    with contextlib.suppress(ChildProcessError):
+        os.waitpid(pid, 0 if block else os.WNOHANG)
+
+
+def get_create_time(pid: int) -> Optional[float]:
+    """Get the start time of a process.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        Process start time as Unix timestamp, or None if process not found
+    """
+    if _HAVE_PROC_STAT:
+        return _proc_start_time(pid)
+    try:
+        return psutil.Process(pid).create_time()
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+
+def _same_process(proc: psutil.Process, create_time: Optional[float]) -> bool:
+    """Check that a process is the one that was started at create_time.
+
+    Args:
+        proc: Process currently owning the PID
+        create_time: Recorded process start time, or None to skip the check
+
+    Returns:
+        False if the PID has been reused by a different process
+    """
+    if create_time is None:
+        return True
+    return same_create_time(proc.create_time(), create_time)
+
+
+def same_create_time(observed: float, recorded: Optional[float]) -> bool:
+    """Compare an observed process start time with a recorded one.
+
+    Args:
+        observed: Start time of the process currently owning the PID
+        recorded: Start time recorded when the process was started, or None
+
+    Returns:
+        True if both belong to the same process (or nothing was recorded)
+    """
+    return recorded is None or abs(observed - recorded) <= CREATE_TIME_TOLERANCE
+
+
+@functools.lru_cache(maxsize=None)
+def _boot_time() -> float:
+    """Get the system boot time, read once as psutil does for create_time()."""
+    return psutil.boot_time()
+
+
+def _proc_start_time(pid: int) -> Optional[float]:
+    """Read the start time of a process from ``/proc/<pid>/stat`` (Linux only).
+
+    Start times are computed the same way psutil does.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        Start time as Unix timestamp, or None if the process does not exist
+        or is a zombie
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            # The command name may contain spaces and parentheses
+            fields = f.read().rsplit(b")", 1)[1].split()
+    except (OSError, IndexError):
+        return None
+
+    # fields[0] is the state (field 3 of stat), fields[19] the start time
+    # in clock ticks after boot (field 22)
+    if fields[0] == b"Z":
+        return None
+    return _boot_time() + int(fields[19]) / _CLOCK_TICKS
+
+
+def live_process_start_times(pids: List[int]) -> Optional[Dict[int, float]]:
+    """Look up the start times of running processes directly from /proc.
+
+    Only ``/proc/<pid>/stat`` is read for each PID, so no psutil.Process
+    objects are built.
+
+    Args:
+        pids: Process IDs to look up
+
+    Returns:
+        Mapping of PID to start time (Unix timestamp) for processes that are
+        running and not zombies, or None where /proc is not available
+    """
+    if not _HAVE_PROC_STAT:
+        return None
+
+    start_times = {}
+    for pid in pids:
+        started = _proc_start_time(pid)
+        if started is not None:
+            start_times[pid] = started
+    return start_times
+
+
 def kill_process_tree(pid: int, timeout: int = 5) -> bool:
     """Kill a process and all its children.
 
@@ -120,34 +399,266 @@ def kill_process_tree(pid: int, timeout: int = 5) -> bool:
     Returns:
         True if process was killed successfully, False otherwise
     """
+    return kill_process_trees([pid], timeout)[pid]
+
+
+def kill_process_trees(pids: List[int], timeout: int = 5) -> Dict[int, bool]:
+    """Kill several processes and all their children concurrently.
+
+    Every process is sent SIGTERM before any is waited for, and all of them
+    share a single graceful-shutdown timeout. Processes that lead their own
+    process group (as everything started by backdrop does) are signalled
+    with a single killpg(); others fall back to walking their children.
+
+    Args:
+        pids: Process IDs
+        timeout: Timeout in seconds for graceful shutdown
+
+    Returns:
+        Mapping of PID to True if that process was killed successfully
+    """
+    results = {}
+    groups: List[int] = []
+    procs: List[psutil.Process] = []
+
+    for pid in pids:
+        if _is_group_leader(pid):
+            try:
+                os.killpg(pid, signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                results[pid] = False
+                continue
+
+            groups.append(pid)
+            results[pid] = True
+            continue
+
+        try:
+            parent = psutil.Process(pid)
+            children = parent.children(recursive=True)
+
+            # Send SIGTERM to parent and children
+            for child in children:
+                with contextlib.suppress(psutil.NoSuchProcess):
+                    child.terminate()
+
+            parent.terminate()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            results[pid] = False
+            continue
+
+        procs.extend([*children, parent])
+        results[pid] = True
+
+    # Wait for processes to terminate
+    deadline = time.monotonic() + timeout
+    alive_groups = _wait_process_groups(groups, deadline)
+    gone, alive = psutil.wait_procs(procs, timeout=max(0.0, deadline - time.monotonic()))
+
+    # Force kill any remaining processes
+    for pgid in alive_groups:
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(pgid, signal.SIGKILL)
+    for proc in alive:
+        with contextlib.suppress(psutil.NoSuchProcess):
+            proc.kill()
+    if alive_groups:
+        _wait_process_groups(alive_groups, time.monotonic() + 0.5)
+    if alive:
+        psutil.wait_procs(alive, timeout=0.5)
+
+    return results
+
+
+def _is_group_leader(pid: int) -> bool:
+    """Check whether a process is the leader of its own process group.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        True if the process group ID equals the PID
+    """
     try:
-        parent = psutil.Process(pid)
-        children = parent.children(recursive=True)
+        return os.getpgid(pid) == pid
+    except OSError:
+        return False
 
-        # Send SIGTERM to parent and children
-        for child in children:
-            with contextlib.suppress(psutil.NoSuchProcess):
-                child.terminate()
 
-        parent.terminate()
+def _wait_process_groups(pgids: List[int], deadline: float) -> List[int]:
+    """Wait until every member of the given process groups has exited.
 
-        # Wait for processes to terminate
-        gone, alive = psutil.wait_procs([*children, parent], timeout=timeout, callback=None)
+    Args:
+        pgids: Process group IDs (the PIDs of their leaders)
+        deadline: time.monotonic() value to give up at
 
-        # Force kill any remaining processes
-        for proc in alive:
-            with contextlib.suppress(psutil.NoSuchProcess):
-                proc.kill()
+    Returns:
+        Process groups that still have members at the deadline
+    """
+    # Usually the whole group exits with its leader, so sleep until the
+    # leaders are gone before polling the groups for stragglers
+    _wait_for_exit(pgids, deadline)
 
-        return True
+    alive = list(pgids)
+    delay = 0.005
+    while True:
+        for pgid in alive:
+            # A leader that is our own child stays a zombie until it is reaped
+            with contextlib.suppress(ChildProcessError):
+                os.waitpid(pgid, os.WNOHANG)
+        alive = [pgid for pgid in alive if _process_group_exists(pgid)]
 
-    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        remaining = deadline - time.monotonic()
+        if not alive or remaining <= 0:
+            return alive
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.05)
+
+
+def _wait_for_exit(pids: List[int], deadline: float) -> None:
+    """Sleep until the given processes have exited or the deadline passes.
+
+    Uses pidfds (Linux 5.3+, Python 3.9+), so the kernel wakes us as soon as
+    each process exits. Returns immediately where pidfds are not available,
+    leaving the caller to poll.
+
+    Args:
+        pids: Process IDs
+        deadline: time.monotonic() value to give up at
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return
+
+    with selectors.DefaultSelector() as selector:
+        for pid in pids:
+            try:
+                fd = pidfd_open(pid)
+            except OSError:
+                # Already gone, or the kernel does not support pidfds
+                continue
+            selector.register(fd, selectors.EVENT_READ)
+
+        try:
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                # A pidfd becomes readable when its process exits
+                for key, _ in selector.select(remaining):
+                    selector.unregister(key.fd)
+                    os.close(key.fd)
+        finally:
+            for fd in list(selector.get_map()):
+                os.close(fd)
+
+
+def _process_group_exists(pgid: int) -> bool:
+    """Check whether a process group still has any members.
+
+    Args:
+        pgid: Process group ID
+
+    Returns:
+        True if at least one process in the group exists
+    """
+    try:
+        os.killpg(pgid, 0)
+    except ProcessLookupError:
         return False
+    except PermissionError:
+        # Members exist but belong to another user
+        pass
+    return True
+
+
+def command_argv(command: str, cwd: Path) -> List[str]:
+    """Build the argument vector for running a command.
 
+    Commands made of plain words are executed directly, so no intermediate
+    shell is started and the command itself becomes the session leader.
+    Anything using shell syntax (quoting, pipes, variables, globs, leading
+    ``VAR=value`` assignments) or naming a builtin runs under ``/bin/sh -c``.
 
+    Args:
+        command: Shell command
+        cwd: Working directory the command will run in
+
+    Returns:
+        Argument vector whose first element is an absolute path
+    """
+    if not _SHELL_METACHARS.search(command):
+        # Without quotes or backslashes, shlex.split() would split on whitespace too
+        words = command.split()
+        if words and "=" not in words[0]:
+            program = words[0]
+            if os.sep in program:
+                # Relative paths are relative to the command's working directory
+                program = os.path.join(cwd, program)
+            executable = shutil.which(program)
+            if executable is not None:
+                return [os.path.abspath(executable), *words[1:]]
+
+    return ["/bin/sh", "-c", command]
+
+
+def spawn_process(argv: List[str], stdout_fd: int, stderr_fd: int, cwd: Path) -> int:
+    """Start a command in a new session with its output sent to open log files.
+
+    Uses ``os.posix_spawn`` so libc performs the fork/redirect/exec sequence
+    without copying this process's page tables or running Python code in the
+    child. posix_spawn cannot change directory, so subprocess.Popen (which
+    uses vfork on CPython 3.10+) is used when cwd is not the current
+    directory, or where posix_spawn's setsid flag is not supported.
+
+    Args:
+        argv: Program and arguments; argv[0] must be an absolute path
+        stdout_fd: File descriptor to use as the command's stdout
+        stderr_fd: File descriptor to use as the command's stderr
+        cwd: Working directory for the command
+
+    Returns:
+        Process ID of the started command
+
+    Raises:
+        OSError: If the command could not be started
+    """
+    if os.path.samefile(cwd, os.curdir):
+        try:
+            return os.posix_spawn(
+                argv[0],
+                argv,
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                    (os.POSIX_SPAWN_DUP2, stdout_fd, 1),
+                    (os.POSIX_SPAWN_DUP2, stderr_fd, 2),
+                ],
+                setsid=True,
+                # Python ignores these; restore the defaults like subprocess does
+                setsigdef=(signal.SIGPIPE, signal.SIGXFSZ),
+            )
+        except NotImplementedError:
+            pass
+
+    proc = subprocess.Popen(
+        argv,
+        stdin=subprocess.DEVNULL,
+        stdout=stdout_fd,
+        stderr=stderr_fd,
+        cwd=cwd,
+        start_new_session=True,
+    )
+    return proc.pid
+
+
+@functools.lru_cache(maxsize=256)
 def sanitize_name(name: str) -> str:
     """Sanitize a process name for use in filenames.
 
+    Results are memoized, so long-lived managers that address the same
+    processes repeatedly only sanitize each name once.
+
     Args:
         name: Process name or shell command
 
@@ -165,17 +676,88 @@ def sanitize_name(name: str) -> str:
         else:
             # Fallback to first part if no clean command found
             name = parts[0]
-    
+
     # Extract basename if it's a path
     name = os.path.basename(name)
-    
+
     # Remove file extension if present
-    if name.endswith((".py", ".js", ".rb", ".sh")):
-        name = Path(name).stem
+    stem, _, extension = name.rpartition(".")
+    if stem and extension in _SCRIPT_EXTENSIONS:
+        name = stem
 
     # Replace unsafe characters
-    safe_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_")
-    return "".join(c if c in safe_chars else "_" for c in name)
+    return _UNSAFE_NAME_CHARS.sub("_", name)
+
+
+class PidRecord(NamedTuple):
+    """Contents of a PID file."""
+
+    pid: int
+    # Process start time, to detect PID reuse
+    create_time: Optional[float] = None
+    # Command and working directory the process was started with
+    command: Optional[str] = None
+    cwd: Optional[str] = None
+
+
+def read_pid_file(pid_file: Path) -> PidRecord:
+    """Read a PID file.
+
+    PID files written by older versions hold just the PID, optionally followed
+    by the create time on a second line; the fields they lack are None.
+
+    Args:
+        pid_file: Path of the PID file
+
+    Returns:
+        Record stored in the PID file
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is empty or malformed
+    """
+    with open(pid_file, encoding="utf-8") as f:
+        content = f.read()
+
+    if content.startswith("{"):
+        data = json.loads(content)
+        if not isinstance(data, dict):
+            raise ValueError(f"Malformed PID file: {pid_file}")
+        pid = data.get("pid")
+        create_time = data.get("create_time")
+        command = data.get("command")
+        cwd = data.get("cwd")
+        # bool is a subclass of int, but never a valid PID or timestamp
+        if not isinstance(pid, int) or isinstance(pid, bool):
+            raise ValueError(f"Malformed PID file: {pid_file}")
+        if create_time is not None and (
+            not isinstance(create_time, (int, float)) or isinstance(create_time, bool)
+        ):
+            raise ValueError(f"Malformed PID file: {pid_file}")
+        if not isinstance(command, (str, type(None))) or not isinstance(cwd, (str, type(None))):
+            raise ValueError(f"Malformed PID file: {pid_file}")
+        return PidRecord(pid, None if create_time is None else float(create_time), command, cwd)
+
+    fields = content.split()
+    if not fields:
+        raise ValueError(f"Empty PID file: {pid_file}")
+    create_time = float(fields[1]) if len(fields) > 1 else None
+    return PidRecord(int(fields[0]), create_time)
+
+
+def write_pid_file(pid_file: Path, record: PidRecord) -> None:
+    """Atomically write a PID file.
+
+    The record is written to a temporary file which is then renamed over the
+    PID file, so readers never see a truncated or partially written file.
+
+    Args:
+        pid_file: Path of the PID file
+        record: Record to store
+    """
+    tmp_file = pid_file.with_suffix(".pid.tmp")
+    tmp_file.write_text(json.dumps(record._asdict()), encoding="utf-8")
+    os.replace(tmp_file, pid_file)
 
 
 def ensure_directories(base_dir: Path) -> Tuple[Path, Path]:
@@ -190,47 +772,10 @@ def ensure_directories(base_dir: Path) -> Tuple[Path, Path]:
     pids_dir = base_dir / "pids"
     logs_dir = base_dir / "logs"
 
-    pids_dir.mkdir(parents=True, exist_ok=True)
-    logs_dir.mkdir(parents=True, exist_ok=True)
+    # Checking first is cheaper than mkdir(exist_ok=True), which always
+    # attempts the mkdir syscall
+    for directory in (pids_dir, logs_dir):
+        if not directory.is_dir():
+            directory.mkdir(parents=True, exist_ok=True)
 
     return pids_dir, logs_dir
-
-
-def daemonize() -> None:
-    """Daemonize the current process.
-
-    This performs a double fork to properly detach from the terminal.
-    """
-    # First fork
-    try:
-        pid = os.fork()
-        if pid > 0:
-            # Parent process exits
-            sys.exit(0)
-    except OSError as e:
-        sys.stderr.write(f"First fork failed: {e}\n")
-        sys.exit(1)
-
-    # Decouple from parent environment
-    os.chdir("/")
-    os.setsid()
-    os.umask(0)
-
-    # Second fork
-    try:
-        pid = os.fork()
-        if pid > 0:
-            # Parent process exits
-            sys.exit(0)
-    except OSError as e:
-        sys.stderr.write(f"Second fork failed: {e}\n")
-        sys.exit(1)
-
-    # Redirect standard file descriptors
-    sys.stdout.flush()
-    sys.stderr.flush()
-
-    # Close file descriptors
-    devnull = os.open(os.devnull, os.O_RDWR)
-    os.dup2(devnull, sys.stdin.fileno())
-    os.close(devnull)
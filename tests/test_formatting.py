@@ -0,0 +1,85 @@
+"""Tests comparing the display formatters with their original implementations."""
+
+import random
+import time
+
+import pytest
+
+from backdrop.utils import format_duration, format_memory, format_uptime
+
+
+def reference_format_uptime(start_time: float) -> str:
+    """format_uptime() as it was before it was made branch-light."""
+    uptime_seconds = int(time.time() - start_time)
+
+    days = uptime_seconds // 86400
+    hours = (uptime_seconds % 86400) // 3600
+    minutes = (uptime_seconds % 3600) // 60
+    seconds = uptime_seconds % 60
+
+    parts = []
+    if days > 0:
+        parts.append(f"{days}d")
+    if hours > 0:
+        parts.append(f"{hours}h")
+    if minutes > 0:
+        parts.append(f"{minutes}m")
+    if seconds > 0 or not parts:
+        parts.append(f"{seconds}s")
+
+    return " ".join(parts[:2])
+
+
+def reference_format_memory(bytes_value: int) -> str:
+    """format_memory() as it was before it was made branch-light."""
+    value = float(bytes_value)
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if value < 1024.0:
+            return f"{value:.1f} {unit}"
+        value /= 1024.0
+    return f"{value:.1f} PB"
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    now = 1_700_000_000.0
+    monkeypatch.setattr(time, "time", lambda: now)
+    return now
+
+
+@pytest.mark.parametrize(
+    "seconds", [0, 1, 59, 60, 61, 3599, 3600, 3601, 3660, 86399, 86400, 86401, 90061]
+)
+def test_format_uptime_boundaries(frozen_time, seconds):
+    start_time = frozen_time - seconds
+    assert format_uptime(start_time) == reference_format_uptime(start_time)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_format_uptime_matches_reference(frozen_time, seed):
+    rng = random.Random(seed)
+    for _ in range(500):
+        # Mix short and long uptimes, with fractional start times
+        start_time = frozen_time - rng.uniform(0, 10 ** rng.randint(1, 8))
+        assert format_uptime(start_time) == reference_format_uptime(start_time), start_time
+
+
+def test_format_duration_matches_format_uptime(frozen_time):
+    for seconds in range(0, 200_000, 37):
+        assert format_duration(seconds) == format_uptime(frozen_time - seconds)
+
+
+@pytest.mark.parametrize(
+    "bytes_value",
+    [0, 1, 1023, 1024, 1025, 1024**2 - 1, 1024**2, 1024**3, 1024**4, 1024**5, 1024**7],
+)
+def test_format_memory_boundaries(bytes_value):
+    assert format_memory(bytes_value) == reference_format_memory(bytes_value)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_format_memory_matches_reference(seed):
+    rng = random.Random(seed)
+    for _ in range(500):
+        bytes_value = rng.randrange(1 << rng.randint(1, 64))
+        assert format_memory(bytes_value) == reference_format_memory(bytes_value), bytes_value
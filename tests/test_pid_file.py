@@ -0,0 +1,69 @@
+"""Tests for reading and writing PID files."""
+
+import pytest
+
+from backdrop.utils import PidRecord, read_pid_file, write_pid_file
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (
+            '{"pid": 1234, "create_time": 1700000000.5, "command": "sleep 30", "cwd": "/srv"}',
+            PidRecord(1234, 1700000000.5, "sleep 30", "/srv"),
+        ),
+        ('{"pid": 1234, "create_time": 1700000000}', PidRecord(1234, 1700000000.0)),
+        ('{"pid": 1234}', PidRecord(1234)),
+        ("1234", PidRecord(1234)),
+        ("1234\n", PidRecord(1234)),
+        ("1234\n1700000000.5\n", PidRecord(1234, 1700000000.5)),
+    ],
+)
+def test_read_pid_file(tmp_path, content, expected):
+    pid_file = tmp_path / "app.pid"
+    pid_file.write_text(content, encoding="utf-8")
+
+    assert read_pid_file(pid_file) == expected
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "\n",
+        "abc",
+        "1234\nnot-a-time\n",
+        "{",
+        '["pid", 1234]',
+        "{}",
+        '{"pid": "1234"}',
+        '{"pid": 1234.0}',
+        '{"pid": true}',
+        '{"pid": null}',
+        '{"pid": 1234, "create_time": "1700000000"}',
+        '{"pid": 1234, "create_time": false}',
+        '{"pid": 1234, "command": ["sleep", "30"]}',
+        '{"pid": 1234, "cwd": 0}',
+    ],
+)
+def test_read_pid_file_malformed(tmp_path, content):
+    pid_file = tmp_path / "app.pid"
+    pid_file.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        read_pid_file(pid_file)
+
+
+def test_read_pid_file_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_pid_file(tmp_path / "missing.pid")
+
+
+def test_write_pid_file_round_trip(tmp_path):
+    pid_file = tmp_path / "app.pid"
+    record = PidRecord(1234, 1700000000.5, "python -m http.server", "/srv")
+
+    write_pid_file(pid_file, record)
+
+    assert read_pid_file(pid_file) == record
+    assert list(tmp_path.iterdir()) == [pid_file]
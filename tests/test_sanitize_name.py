@@ -0,0 +1,83 @@
+"""Tests comparing sanitize_name() with the original implementation."""
+
+import os
+import random
+from pathlib import Path
+
+import pytest
+
+from backdrop.utils import sanitize_name
+
+# Characters that exercise each step: word splitting, env assignments,
+# options, paths, extensions and unsafe characters
+ALPHABET = "abcXYZ019 -_=./\\:@$é\t"
+TOKENS = [
+    "python",
+    "server",
+    ".py",
+    ".js",
+    ".rb",
+    ".sh",
+    ".txt",
+    "PORT=8000",
+    "--host",
+    "/usr/bin/",
+]
+
+
+def reference_sanitize_name(name: str) -> str:
+    """sanitize_name() as it was before it was optimized."""
+    if " " in name:
+        parts = name.split()
+        for part in parts:
+            if "=" not in part and not part.startswith("-"):
+                name = part
+                break
+        else:
+            name = parts[0]
+
+    name = os.path.basename(name)
+
+    if name.endswith((".py", ".js", ".rb", ".sh")):
+        name = Path(name).stem
+
+    safe_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_")
+    return "".join(c if c in safe_chars else "_" for c in name)
+
+
+def random_name(rng: random.Random) -> str:
+    pieces = [
+        rng.choice(TOKENS) if rng.random() < 0.3 else rng.choice(ALPHABET)
+        for _ in range(rng.randint(1, 12))
+    ]
+    name = "".join(pieces)
+    # Both implementations fail on a name that is nothing but whitespace
+    return name if name.split() else name + "x"
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "sleep 30",
+        "my_server.py",
+        "PYTHONPATH=/opt python server.py",
+        "--verbose -x",
+        "/usr/local/bin/app.sh",
+        ".py",
+        "a.b.py",
+        "x..js",
+        "archive.tar.gz",
+        "dir/",
+        "naïve app",
+    ],
+)
+def test_sanitize_name_examples(name):
+    assert sanitize_name(name) == reference_sanitize_name(name)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_sanitize_name_matches_reference(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        name = random_name(rng)
+        assert sanitize_name(name) == reference_sanitize_name(name), name